@@ -4,21 +4,33 @@ NFT-Based API Access Control Server
 FastAPI backend that verifies wallet ownership and NFT holdings
 """
 
-from fastapi import FastAPI, HTTPException, Header, Request
+from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
+from fastapi.responses import JSONResponse, Response
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from pydantic import BaseModel, ConfigDict, Field
 from algosdk import encoding
-from algosdk.v2client import indexer
+import httpx
 import jwt
-import redis
+from cachetools import TLRUCache, TTLCache
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from redis import asyncio as aioredis
+import asyncio
+import concurrent.futures
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+import hashlib
 import secrets
-import json
+import threading
+import orjson
 import time
-import base64
+import binascii
 import os
+import re
 from dotenv import load_dotenv
-from typing import Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 # Load environment variables
 load_dotenv()
@@ -31,21 +43,41 @@ JWT_SECRET = os.getenv('JWT_SECRET', secrets.token_hex(32))
 REDIS_HOST = os.getenv('REDIS_HOST', 'localhost')
 REDIS_PORT = int(os.getenv('REDIS_PORT', '6379'))
 REDIS_DB = int(os.getenv('REDIS_DB', '0'))
+REDIS_CONNECT_TIMEOUT = float(os.getenv('REDIS_CONNECT_TIMEOUT', '0.5'))
+REDIS_HEALTH_INTERVAL = float(os.getenv('REDIS_HEALTH_INTERVAL', '5'))
 API_HOST = os.getenv('API_HOST', '0.0.0.0')
 API_PORT = int(os.getenv('API_PORT', '8000'))
+API_WORKERS = int(os.getenv('API_WORKERS', '1'))
+NFT_CACHE_TTL = int(os.getenv('NFT_CACHE_TTL', '60'))
+VERIFY_BATCH_SIZE = int(os.getenv('VERIFY_BATCH_SIZE', '64'))
+VERIFY_BATCH_WINDOW = float(os.getenv('VERIFY_BATCH_WINDOW', '0.002'))
+VERIFY_PROCESSES = int(os.getenv('VERIFY_PROCESSES', str(max(1, (os.cpu_count() or 1) // API_WORKERS))))
+
+# Ed25519 keypair for EdDSA access tokens, derived from JWT_SECRET so every
+# worker signs with the same key; validators only need the public key
+JWT_SIGNING_KEY = Ed25519PrivateKey.from_private_bytes(
+    hashlib.sha256(JWT_SECRET.encode('utf-8')).digest()
+)
+JWT_VERIFY_KEY = JWT_SIGNING_KEY.public_key()
+JWT_PUBLIC_KEY_PEM = JWT_VERIFY_KEY.public_bytes(
+    serialization.Encoding.PEM,
+    serialization.PublicFormat.SubjectPublicKeyInfo
+).decode('utf-8')
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson"""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
 
 # Initialize FastAPI
 app = FastAPI(
     title="NFT API Access Control",
     description="API authentication using Algorand NFT ownership",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
-# Warn if NFT_ASSET_ID is not configured
-if NFT_ASSET_ID == 0:
-    print("⚠️  WARNING: NFT_ASSET_ID is not set in .env file!")
-    print("   Please mint an NFT and update the NFT_ASSET_ID in your .env file")
-
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -55,45 +87,65 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize Redis
-try:
-    redis_client = redis.Redis(
-        host=REDIS_HOST,
-        port=REDIS_PORT,
-        db=REDIS_DB,
-        decode_responses=True
-    )
-    redis_client.ping()
-    print("✅ Redis connected")
-except Exception as e:
-    print(f"⚠️  Redis connection failed: {e}")
-    print("Challenge storage will use in-memory fallback")
-    redis_client = None
-
-# In-memory fallback for challenges
-challenge_store = {}
-
-# Initialize Algorand Indexer
-indexer_client = indexer.IndexerClient(
-    indexer_token="",
-    indexer_address=INDEXER_URL
+# Initialize Redis (async client over a shared connection pool;
+# connectivity is checked in the startup event)
+redis_pool = aioredis.ConnectionPool(
+    host=REDIS_HOST,
+    port=REDIS_PORT,
+    db=REDIS_DB,
+    decode_responses=True,
+    max_connections=64
+)
+redis_client = aioredis.Redis(connection_pool=redis_pool)
+
+# In-memory fallback for challenges (bounded, entries expire after their TTL)
+challenge_store = TLRUCache(
+    maxsize=100_000,
+    ttu=lambda _address, stored, now: now + stored["ttl"]
 )
 
+# Pre-read OS entropy, sliced into challenge nonces
+nonce_entropy = bytearray()
+nonce_lock = threading.Lock()
+
+# Recently decoded access tokens (raw token -> payload)
+jwt_cache = TTLCache(maxsize=10_000, ttl=60)
+jwt_codec = jwt.PyJWT()
+
+# Pending signature verifications, drained by the batch worker
+verify_queue: Optional[asyncio.Queue] = None
+verify_worker: Optional[asyncio.Task] = None
+verify_executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+verify_batches = set()
+
+# Algorand Indexer client (shared keep-alive HTTP/2 client, built on startup)
+indexer_client: Optional[httpx.AsyncClient] = None
+
+# Algorand address and base64-encoded Ed25519 signature (64 bytes) lengths
+ADDRESS_LENGTH = 58
+SIGNATURE_B64_LENGTH = 88
+
 # Request/Response Models
-class ChallengeRequest(BaseModel):
-    address: str
+class StrictModel(BaseModel):
+    """Rejects unknown fields and oversized strings during validation"""
+    model_config = ConfigDict(extra='forbid', str_max_length=512)
 
-class VerifyRequest(BaseModel):
-    address: str
-    signature: str
-    challenge: dict
+class ChallengeRequest(StrictModel):
+    address: str = Field(max_length=ADDRESS_LENGTH)
 
-class ChallengeResponse(BaseModel):
+class ChallengeResponse(StrictModel):
     message: str
     nonce: str
     timestamp: int
     address: str
     domain: str
+    # Base64 of the exact bytes to sign (not itself part of the signed message)
+    message_b64: Optional[str] = None
+
+class VerifyRequest(StrictModel):
+    address: str = Field(max_length=ADDRESS_LENGTH)
+    signature: str = Field(max_length=SIGNATURE_B64_LENGTH)
+    challenge: ChallengeResponse
 
 class TokenResponse(BaseModel):
     access_token: str
@@ -101,41 +153,51 @@ class TokenResponse(BaseModel):
     expires_in: int
 
 # Utility Functions
-def store_challenge(address: str, challenge: dict, ttl: int = 300):
-    """Store challenge with 5-minute expiry"""
+def encode_challenge(challenge: dict) -> bytes:
+    """Canonical challenge bytes - exactly what the wallet signs"""
+    return orjson.dumps(challenge)
+
+async def store_challenge(address: str, message: bytes, ttl: int = 300):
+    """Store canonical challenge bytes with 5-minute expiry"""
     if redis_client:
-        redis_client.setex(
+        await redis_client.setex(
             f"challenge:{address}",
             ttl,
-            json.dumps(challenge)
+            message
         )
     else:
         # In-memory fallback
         challenge_store[address] = {
-            "data": challenge,
-            "expires": time.time() + ttl
+            "data": message,
+            "ttl": ttl
         }
 
-def get_challenge(address: str) -> Optional[dict]:
-    """Retrieve stored challenge"""
+async def pop_challenge(address: str) -> Optional[bytes]:
+    """Retrieve and delete stored challenge bytes in a single round-trip"""
     if redis_client:
-        data = redis_client.get(f"challenge:{address}")
-        return json.loads(data) if data else None
+        async with redis_client.pipeline() as pipe:
+            pipe.get(f"challenge:{address}")
+            pipe.delete(f"challenge:{address}")
+            data, _ = await pipe.execute()
+        return data.encode('utf-8') if data else None
     else:
         # In-memory fallback
-        stored = challenge_store.get(address)
-        if stored and stored['expires'] > time.time():
-            return stored['data']
-        elif stored:
-            del challenge_store[address]
-        return None
-
-def delete_challenge(address: str):
-    """Delete challenge after use"""
-    if redis_client:
-        redis_client.delete(f"challenge:{address}")
-    else:
-        challenge_store.pop(address, None)
+        stored = challenge_store.pop(address, None)
+        return stored['data'] if stored else None
+
+def generate_nonce(nbytes: int = 32) -> str:
+    """Random hex nonce, sliced from a 4 KiB buffer of OS entropy"""
+    with nonce_lock:
+        if len(nonce_entropy) < nbytes:
+            nonce_entropy.extend(os.urandom(4096))
+        chunk = bytes(nonce_entropy[:nbytes])
+        del nonce_entropy[:nbytes]
+    return chunk.hex()
+
+@lru_cache(maxsize=4096)
+def decode_address(address: str) -> bytes:
+    """Decode Algorand address to public key bytes (memoized per address)"""
+    return encoding.decode_address(address)
 
 def verify_signature(message: bytes, signature: bytes, address: str) -> bool:
     """
@@ -154,7 +216,7 @@ def verify_signature(message: bytes, signature: bytes, address: str) -> bool:
         from nacl.exceptions import BadSignatureError
 
         # Convert Algorand address to public key bytes
-        public_key_bytes = encoding.decode_address(address)
+        public_key_bytes = decode_address(address)
         verify_key = VerifyKey(public_key_bytes)
 
         # Verify signature
@@ -166,10 +228,115 @@ def verify_signature(message: bytes, signature: bytes, address: str) -> bool:
         print(f"Signature verification error: {e}")
         return False
 
-def check_nft_ownership(address: str, asset_id: int) -> bool:
+def verify_signature_batch(items: List[Tuple[bytes, bytes, str]]) -> List[bool]:
+    """Verify a batch of (message, signature, address) tuples"""
+    return [verify_signature(message, signature, address) for message, signature, address in items]
+
+def new_verify_executor() -> concurrent.futures.ProcessPoolExecutor:
+    """Process pool for signature verification"""
+    # Spawn (not fork) so workers don't inherit the listening socket or
+    # uvicorn's signal handlers
+    return concurrent.futures.ProcessPoolExecutor(
+        max_workers=VERIFY_PROCESSES,
+        mp_context=multiprocessing.get_context('spawn')
+    )
+
+async def run_verify_batch(batch: list):
+    """Verify one batch in the process pool and resolve its futures"""
+    global verify_executor
+
+    loop = asyncio.get_running_loop()
+    items = [(message, signature, address) for message, signature, address, _ in batch]
+
+    try:
+        executor = verify_executor
+        try:
+            results = await loop.run_in_executor(executor, verify_signature_batch, items)
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM-killed); replace the pool once, however
+            # many batches noticed, and verify this batch in-process
+            print("⚠️  Signature verification pool broke, restarting it")
+            if verify_executor is executor:
+                verify_executor = new_verify_executor()
+                executor.shutdown(wait=False, cancel_futures=True)
+            results = verify_signature_batch(items)
+    except Exception as e:
+        # An infrastructure fault must not read as an invalid signature
+        print(f"Signature batch error: {e}")
+        for *_, future in batch:
+            if not future.done():
+                future.set_exception(HTTPException(
+                    status_code=503,
+                    detail="Signature verification temporarily unavailable"
+                ))
+        return
+
+    for (*_, future), is_valid in zip(batch, results):
+        if not future.done():
+            future.set_result(is_valid)
+
+async def signature_batch_worker():
+    """
+    Drain queued verifications in batches
+
+    Collects up to VERIFY_BATCH_SIZE requests (or whatever arrives within
+    VERIFY_BATCH_WINDOW seconds) and hands each batch to the verification
+    process pool, so Ed25519 math runs in parallel outside the GIL.
+    """
+    loop = asyncio.get_running_loop()
+
+    while True:
+        batch = [await verify_queue.get()]
+        deadline = loop.time() + VERIFY_BATCH_WINDOW
+
+        while len(batch) < VERIFY_BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(verify_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        task = asyncio.create_task(run_verify_batch(batch))
+        verify_batches.add(task)
+        task.add_done_callback(verify_batches.discard)
+
+async def verify_signature_batched(message: bytes, signature: bytes, address: str) -> bool:
+    """Submit a signature to the batch worker and await its result"""
+    if verify_queue is None:
+        return verify_signature(message, signature, address)
+
+    future = asyncio.get_running_loop().create_future()
+    await verify_queue.put((message, signature, address, future))
+    return await future
+
+async def account_info(address: str) -> dict:
+    """Fetch account information from the indexer"""
+    response = await indexer_client.get(f"/v2/accounts/{address}")
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+async def asset_holding(address: str, asset_id: int) -> Optional[dict]:
+    """Fetch a single asset holding for an account (None if not held)"""
+    response = await indexer_client.get(
+        f"/v2/accounts/{address}/assets",
+        params={"asset-id": asset_id}
+    )
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+
+    holdings = orjson.loads(response.content).get('assets', [])
+    return holdings[0] if holdings else None
+
+async def check_nft_ownership(address: str, asset_id: int) -> bool:
     """
     Check if wallet address owns the NFT
 
+    Results are cached in Redis for NFT_CACHE_TTL seconds so repeated
+    authentications skip the indexer round-trip.
+
     Args:
         address: Algorand wallet address
         asset_id: NFT asset ID
@@ -177,56 +344,151 @@ def check_nft_ownership(address: str, asset_id: int) -> bool:
     Returns:
         True if address owns the NFT, False otherwise
     """
-    try:
-        account_info = indexer_client.account_info(address)
-        assets = account_info.get('account', {}).get('assets', [])
+    cache_key = f"nft_owner:{address}:{asset_id}"
 
-        for asset in assets:
-            if asset.get('asset-id') == asset_id and asset.get('amount', 0) > 0:
-                return True
+    if redis_client:
+        try:
+            cached = await redis_client.get(cache_key)
+            if cached is not None:
+                return cached == "1"
+        except Exception as e:
+            print(f"NFT ownership cache error: {e}")
 
-        return False
+    try:
+        holding = await asset_holding(address, asset_id)
+        owns_nft = holding is not None and holding.get('amount', 0) > 0
 
     except Exception as e:
         print(f"NFT ownership check error: {e}")
         return False
 
+    if redis_client:
+        try:
+            await redis_client.setex(cache_key, NFT_CACHE_TTL, "1" if owns_nft else "0")
+        except Exception as e:
+            print(f"NFT ownership cache error: {e}")
+
+    return owns_nft
+
+def decode_access_token(token: str) -> dict:
+    """
+    Decode and validate a JWT access token
+
+    Decoded payloads are cached briefly so repeated requests with the same
+    bearer token skip the signature check; expiry is still enforced on every hit.
+
+    Raises:
+        jwt.ExpiredSignatureError: Token has expired
+        jwt.InvalidTokenError: Token is malformed or has a bad signature
+    """
+    payload = jwt_cache.get(token)
+    if payload is not None:
+        if payload.get('exp', 0) <= time.time():
+            jwt_cache.pop(token, None)
+            raise jwt.ExpiredSignatureError("Signature has expired")
+        return payload
+
+    payload = jwt_codec.decode(token, JWT_VERIFY_KEY, algorithms=['EdDSA'])
+    jwt_cache[token] = payload
+    return payload
+
 def is_valid_algorand_address(address: str) -> bool:
     """Validate Algorand address format"""
     try:
-        encoding.decode_address(address)
+        decode_address(address)
         return True
     except:
         return False
 
+# Dependencies
+bearer_scheme = HTTPBearer(auto_error=False)
+
+# Compact JWS: three base64url segments, bounded length
+BEARER_TOKEN = re.compile(r'[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+')
+BEARER_TOKEN_MAX_LENGTH = 4096
+
+async def current_user(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme)
+) -> dict:
+    """Resolve the bearer token on protected routes to its JWT payload"""
+    if credentials is None:
+        raise HTTPException(
+            status_code=401,
+            detail="Missing or invalid Authorization header. Format: Bearer <token>"
+        )
+
+    token = credentials.credentials
+    if len(token) > BEARER_TOKEN_MAX_LENGTH or not BEARER_TOKEN.fullmatch(token):
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+    try:
+        return decode_access_token(token)
+    except jwt.ExpiredSignatureError:
+        raise HTTPException(status_code=401, detail="Token expired")
+    except jwt.InvalidTokenError:
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+# Pre-serialized bodies for static endpoints
+ROOT_BODY = orjson.dumps({
+    "name": "NFT API Access Control",
+    "version": "1.0.0",
+    "status": "active",
+    "nft_asset_id": NFT_ASSET_ID,
+    "endpoints": {
+        "challenge": "POST /auth/challenge",
+        "verify": "POST /auth/verify",
+        "public_key": "GET /auth/public-key",
+        "protected": "GET /api/protected",
+        "status": "GET /api/status"
+    }
+})
+
+STATUS_BODY = orjson.dumps({
+    "status": "online",
+    "message": "This is a public endpoint",
+    "authentication": "not required"
+})
+
+PUBLIC_KEY_BODY = orjson.dumps({
+    "algorithm": "EdDSA",
+    "public_key": JWT_PUBLIC_KEY_PEM
+})
+
+def build_health_body(redis_status: str) -> bytes:
+    """Serialize the /health payload for the given Redis status"""
+    return orjson.dumps({
+        "status": "healthy",
+        "redis": redis_status,
+        "indexer": INDEXER_URL,
+        "nft_configured": NFT_ASSET_ID > 0
+    })
+
+# Rebuilt by the startup event and the Redis health monitor
+health_body = build_health_body("fallback")
+health_monitor: Optional[asyncio.Task] = None
+
+async def redis_health_monitor():
+    """Refresh the /health body from a periodic Redis ping"""
+    global health_body
+
+    while True:
+        await asyncio.sleep(REDIS_HEALTH_INTERVAL)
+        try:
+            await asyncio.wait_for(redis_client.ping(), REDIS_CONNECT_TIMEOUT)
+            health_body = build_health_body("connected")
+        except Exception:
+            health_body = build_health_body("disconnected")
+
 # API Endpoints
 @app.get("/")
 async def root():
     """API information"""
-    return {
-        "name": "NFT API Access Control",
-        "version": "1.0.0",
-        "status": "active",
-        "nft_asset_id": NFT_ASSET_ID,
-        "endpoints": {
-            "challenge": "POST /auth/challenge",
-            "verify": "POST /auth/verify",
-            "protected": "GET /api/protected",
-            "status": "GET /api/status"
-        }
-    }
+    return Response(content=ROOT_BODY, media_type="application/json")
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    redis_status = "connected" if redis_client else "fallback"
-
-    return {
-        "status": "healthy",
-        "redis": redis_status,
-        "indexer": INDEXER_URL,
-        "nft_configured": NFT_ASSET_ID > 0
-    }
+    return Response(content=health_body, media_type="application/json")
 
 @app.post("/auth/challenge", response_model=ChallengeResponse)
 async def create_challenge(request: ChallengeRequest):
@@ -245,18 +507,22 @@ async def create_challenge(request: ChallengeRequest):
     # Generate unique challenge
     challenge = {
         "message": "Authenticate to API service",
-        "nonce": secrets.token_hex(32),
+        "nonce": generate_nonce(),
         "timestamp": int(time.time()),
         "address": address,
         "domain": "api.example.com"
     }
 
-    # Store challenge for 5 minutes
-    store_challenge(address, challenge, ttl=300)
+    # Store the exact bytes to be signed for 5 minutes
+    message = encode_challenge(challenge)
+    await store_challenge(address, message, ttl=300)
 
     print(f"📝 Challenge created for {address}")
 
-    return challenge
+    return {
+        **challenge,
+        "message_b64": binascii.b2a_base64(message, newline=False).decode('ascii')
+    }
 
 @app.post("/auth/verify", response_model=TokenResponse)
 async def verify_signature_and_nft(request: VerifyRequest):
@@ -272,7 +538,7 @@ async def verify_signature_and_nft(request: VerifyRequest):
     """
     address = request.address
     signature_b64 = request.signature
-    challenge_data = request.challenge
+    challenge_data = request.challenge.model_dump(exclude={'message_b64'})
 
     # Check NFT is configured
     if NFT_ASSET_ID == 0:
@@ -281,13 +547,14 @@ async def verify_signature_and_nft(request: VerifyRequest):
             detail="NFT_ASSET_ID not configured. Run mint_nft.py first."
         )
 
-    # 1. Retrieve stored challenge
-    stored_challenge = get_challenge(address)
-    if not stored_challenge:
+    # 1. Retrieve and consume stored challenge (prevent reuse)
+    stored_message = await pop_challenge(address)
+    if not stored_message:
         raise HTTPException(
             status_code=401,
             detail="Challenge not found or expired. Request new challenge."
         )
+    stored_challenge = orjson.loads(stored_message)
 
     # 2. Verify challenge data matches
     if challenge_data != stored_challenge:
@@ -299,18 +566,30 @@ async def verify_signature_and_nft(request: VerifyRequest):
     # 3. Check timestamp (max 5 minutes old)
     current_time = int(time.time())
     if current_time - stored_challenge.get('timestamp', 0) > 300:
-        delete_challenge(address)
         raise HTTPException(
             status_code=401,
             detail="Challenge expired"
         )
 
     # 4. Verify cryptographic signature
+    if len(signature_b64) != SIGNATURE_B64_LENGTH:
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid signature length"
+        )
+
     try:
-        message = json.dumps(challenge_data, separators=(',', ':')).encode('utf-8')
-        signature_bytes = base64.b64decode(signature_b64)
+        signature_bytes = binascii.a2b_base64(signature_b64)
+    except binascii.Error:
+        signature_bytes = b''
+    if len(signature_bytes) != 64:
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid signature length"
+        )
 
-        is_valid = verify_signature(message, signature_bytes, address)
+    try:
+        is_valid = await verify_signature_batched(stored_message, signature_bytes, address)
 
         if not is_valid:
             raise HTTPException(
@@ -318,6 +597,8 @@ async def verify_signature_and_nft(request: VerifyRequest):
                 detail="Invalid signature - wallet ownership not proven"
             )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=401,
@@ -325,7 +606,7 @@ async def verify_signature_and_nft(request: VerifyRequest):
         )
 
     # 5. Check NFT ownership
-    owns_nft = check_nft_ownership(address, NFT_ASSET_ID)
+    owns_nft = await check_nft_ownership(address, NFT_ASSET_ID)
 
     if not owns_nft:
         raise HTTPException(
@@ -333,10 +614,7 @@ async def verify_signature_and_nft(request: VerifyRequest):
             detail=f"NFT (asset {NFT_ASSET_ID}) not found in wallet. API access denied."
         )
 
-    # 6. Delete challenge (prevent reuse)
-    delete_challenge(address)
-
-    # 7. Issue JWT access token
+    # 6. Issue JWT access token
     token_payload = {
         "wallet": address,
         "nft": NFT_ASSET_ID,
@@ -344,7 +622,7 @@ async def verify_signature_and_nft(request: VerifyRequest):
         "exp": current_time + 3600  # 1 hour expiration
     }
 
-    access_token = jwt.encode(token_payload, JWT_SECRET, algorithm='HS256')
+    access_token = jwt_codec.encode(token_payload, JWT_SIGNING_KEY, algorithm='EdDSA')
 
     print(f"✅ Authentication successful for {address}")
 
@@ -354,45 +632,29 @@ async def verify_signature_and_nft(request: VerifyRequest):
         "expires_in": 3600
     }
 
+@app.get("/auth/public-key")
+async def jwt_public_key():
+    """Public key for validating issued access tokens"""
+    return Response(content=PUBLIC_KEY_BODY, media_type="application/json")
+
 @app.get("/api/status")
 async def public_status():
     """Public endpoint - no authentication required"""
-    return {
-        "status": "online",
-        "message": "This is a public endpoint",
-        "authentication": "not required"
-    }
+    return Response(content=STATUS_BODY, media_type="application/json")
 
 @app.get("/api/protected")
-async def protected_endpoint(authorization: Optional[str] = Header(None)):
+async def protected_endpoint(payload: dict = Depends(current_user)):
     """
     Protected endpoint - requires valid JWT from NFT holder
 
     Demonstrates NFT-gated API access.
     """
-    # Check Authorization header
-    if not authorization or not authorization.startswith('Bearer '):
-        raise HTTPException(
-            status_code=401,
-            detail="Missing or invalid Authorization header. Format: Bearer <token>"
-        )
-
-    token = authorization.split(' ')[1]
-
-    # Verify JWT
-    try:
-        payload = jwt.decode(token, JWT_SECRET, algorithms=['HS256'])
-    except jwt.ExpiredSignatureError:
-        raise HTTPException(status_code=401, detail="Token expired")
-    except jwt.InvalidTokenError:
-        raise HTTPException(status_code=401, detail="Invalid token")
-
     wallet_address = payload.get('wallet')
     nft_asset_id = payload.get('nft')
 
     # Optional: Re-verify NFT ownership (catches stolen/transferred NFTs)
-    # Uncomment for maximum security (adds ~200ms latency)
-    # owns_nft = check_nft_ownership(wallet_address, nft_asset_id)
+    # Uncomment for maximum security (cached for NFT_CACHE_TTL seconds)
+    # owns_nft = await check_nft_ownership(wallet_address, nft_asset_id)
     # if not owns_nft:
     #     raise HTTPException(
     #         status_code=403,
@@ -412,27 +674,15 @@ async def protected_endpoint(authorization: Optional[str] = Header(None)):
     }
 
 @app.get("/api/user/info")
-async def user_info(authorization: Optional[str] = Header(None)):
+async def user_info(payload: dict = Depends(current_user)):
     """Get authenticated user information"""
-    if not authorization or not authorization.startswith('Bearer '):
-        raise HTTPException(status_code=401, detail="No authorization token")
-
-    token = authorization.split(' ')[1]
-
-    try:
-        payload = jwt.decode(token, JWT_SECRET, algorithms=['HS256'])
-    except jwt.ExpiredSignatureError:
-        raise HTTPException(status_code=401, detail="Token expired")
-    except jwt.InvalidTokenError:
-        raise HTTPException(status_code=401, detail="Invalid token")
-
     wallet = payload.get('wallet')
     nft = payload.get('nft')
 
     # Get account info from blockchain
     try:
-        account_info = indexer_client.account_info(wallet)
-        balance = account_info.get('account', {}).get('amount', 0) / 1_000_000
+        info = await account_info(wallet)
+        balance = info.get('account', {}).get('amount', 0) / 1_000_000
 
         return {
             "wallet_address": wallet,
@@ -448,7 +698,7 @@ async def user_info(authorization: Optional[str] = Header(None)):
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Custom error response format"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": exc.detail,
@@ -460,6 +710,31 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 @app.on_event("startup")
 async def startup_event():
     """Run on server startup"""
+    global redis_client, indexer_client, verify_queue, verify_worker, verify_executor
+    global health_body, health_monitor
+
+    indexer_client = httpx.AsyncClient(
+        base_url=INDEXER_URL,
+        http2=True,
+        timeout=5.0,
+        limits=httpx.Limits(max_keepalive_connections=32)
+    )
+
+    verify_executor = new_verify_executor()
+    verify_queue = asyncio.Queue()
+    verify_worker = asyncio.create_task(signature_batch_worker())
+
+    try:
+        await asyncio.wait_for(redis_client.ping(), REDIS_CONNECT_TIMEOUT)
+        print("✅ Redis connected")
+        health_body = build_health_body("connected")
+        health_monitor = asyncio.create_task(redis_health_monitor())
+    except Exception as e:
+        print(f"⚠️  Redis connection failed: {e or 'timed out'}")
+        print("Challenge storage will use in-memory fallback")
+        await redis_pool.disconnect()
+        redis_client = None
+
     print("\n" + "=" * 60)
     print("NFT API Access Control Server")
     print("=" * 60)
@@ -475,6 +750,30 @@ async def startup_event():
         print("Then update .env with NFT_ASSET_ID")
     print()
 
+# Shutdown event
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release pooled connections on server shutdown"""
+    global verify_queue, verify_executor
+
+    if verify_worker:
+        verify_worker.cancel()
+    verify_queue = None
+
+    if health_monitor:
+        health_monitor.cancel()
+
+    if verify_executor:
+        verify_executor.shutdown(wait=False, cancel_futures=True)
+        verify_executor = None
+
+    if indexer_client:
+        await indexer_client.aclose()
+
+    if redis_client:
+        await redis_client.aclose()
+    await redis_pool.disconnect()
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -484,8 +783,11 @@ if __name__ == "__main__":
     print()
 
     uvicorn.run(
-        app,
+        "api_server:app",
         host=API_HOST,
         port=API_PORT,
+        workers=API_WORKERS,
+        loop="uvloop",
+        http="httptools",
         log_level="info"
     )
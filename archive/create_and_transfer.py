@@ -16,9 +16,22 @@ TEMP_ADDRESS = "FAAFOQKFCM326G3JJ4IKNO2KVEE6YATW3DA4TWZWCEYSA2IE5YWL3B7EMY"
 ALGOD_URL = "https://testnet-api.algonode.cloud"
 ALGOD_TOKEN = ""
 
-# Load the temp private key from the previous script
-# Since we just generated it, I'll regenerate with same seed approach
-# Actually, let me use a simpler approach - save/load from file
+def wait_for_opt_in(client, asset_id, timeout=30):
+    """Poll until YOUR_WALLET has opted into asset_id, with exponential backoff"""
+    deadline = time.monotonic() + timeout
+    delay = 1
+
+    while True:
+        your_account_info = client.account_info(YOUR_WALLET)
+        assets = your_account_info.get('assets', [])
+        if any(a['asset-id'] == asset_id for a in assets):
+            return True
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 10)
 
 def main():
     client = algod.AlgodClient(ALGOD_TOKEN, ALGOD_URL)
@@ -27,13 +40,7 @@ def main():
     print("NFT Creation & Transfer")
     print("=" * 60)
 
-    # Generate temp wallet (deterministic for this session)
-    import hashlib
-    seed = hashlib.sha256(b"temp_nft_creator_seed_12345").digest()
-    from algosdk import encoding
-    temp_private_key = seed[:32]  # Use first 32 bytes
-
-    # Actually, safer to generate fresh and save
+    # Generate fresh temp wallet
     temp_private_key, temp_address = account.generate_account()
 
     print(f"\n📝 Temporary wallet: {temp_address}")
@@ -51,10 +58,9 @@ def main():
                 break
             else:
                 print(f"Waiting for funds... ({i+1}/{max_retries})")
-                time.sleep(3)
         except Exception as e:
             print(f"Waiting for funding... ({i+1}/{max_retries})")
-            time.sleep(3)
+        time.sleep(min(2 ** i, 10))
     else:
         print("❌ Wallet not funded within timeout")
         print(f"Please fund: {temp_address}")
@@ -96,9 +102,7 @@ def main():
     print(f"\n📥 Checking if your wallet has opted into the asset...")
 
     try:
-        your_account_info = client.account_info(YOUR_WALLET)
-        assets = your_account_info.get('assets', [])
-        has_opted_in = any(a['asset-id'] == asset_id for a in assets)
+        has_opted_in = wait_for_opt_in(client, asset_id, timeout=0)
 
         if not has_opted_in:
             print(f"⚠️  Your wallet needs to opt-in to receive the NFT")
@@ -112,13 +116,8 @@ def main():
             print(f"   https://testnet.algoexplorer.io/asset/{asset_id}")
             print(f"   Click 'Add to Pera Wallet' button")
 
-            print(f"\n⏳ Waiting 30 seconds for you to opt-in...")
-            time.sleep(30)
-
-            # Check again
-            your_account_info = client.account_info(YOUR_WALLET)
-            assets = your_account_info.get('assets', [])
-            has_opted_in = any(a['asset-id'] == asset_id for a in assets)
+            print(f"\n⏳ Waiting up to 30 seconds for you to opt-in...")
+            has_opted_in = wait_for_opt_in(client, asset_id, timeout=30)
 
             if not has_opted_in:
                 print(f"❌ Still not opted in. Please complete opt-in and run transfer manually.")
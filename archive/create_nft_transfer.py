@@ -2,41 +2,167 @@
 """Create NFT with new wallet and transfer to your Pera wallet"""
 
 from algosdk.v2client import algod
-from algosdk import account, transaction
-import json
+from algosdk import account, constants, encoding, error, transaction
+from urllib import parse
+import base64
+import fileinput
+import httpx
+import orjson
+import threading
+import time
 
 # Your Pera Wallet address
 YOUR_WALLET = "5I2JGWH7O5MATWRTKI6BIY2LPVCJ2RWC3QBE3XEYIBS2DFNCDPLNS3HFF4"
+# Public key bytes, decoded once (also rejects a mistyped address at startup)
+YOUR_WALLET_PK = encoding.decode_address(YOUR_WALLET)
 
 # TestNet configuration
 ALGOD_URL = "https://testnet-api.algonode.cloud"
 ALGOD_TOKEN = ""
 
+class PooledAlgodClient(algod.AlgodClient):
+    """AlgodClient that sends every request over one keep-alive HTTP session"""
+
+    def __init__(self, algod_token, algod_address, headers=None):
+        super().__init__(algod_token, algod_address, headers)
+        self.session = httpx.Client(
+            transport=httpx.HTTPTransport(retries=3),
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=32)
+        )
+
+    def algod_request(self, method, requrl, params=None, data=None,
+                      headers=None, response_format="json", timeout=30):
+        header = {"User-Agent": "py-algorand-sdk"}
+        if self.headers:
+            header.update(self.headers)
+        if headers:
+            header.update(headers)
+        if requrl not in constants.no_auth:
+            header[constants.algod_auth_header] = self.algod_token
+
+        if requrl not in constants.unversioned_paths:
+            requrl = algod.api_version_path_prefix + requrl
+        if params:
+            requrl = requrl + "?" + parse.urlencode(params)
+
+        resp = self.session.request(
+            method,
+            self.algod_address + requrl,
+            headers=header,
+            content=data,
+            timeout=timeout
+        )
+
+        if resp.is_error:
+            try:
+                j = resp.json()
+                m = j["message"]
+            except Exception:
+                j, m = {}, resp.text
+            raise error.AlgodHTTPError(m, resp.status_code, j.get("data"))
+
+        if response_format == "json":
+            return resp.json() if resp.content else {}
+        return resp.content
+
+
+# Shared client - one connection pool for every RPC in this script
+CLIENT = PooledAlgodClient(ALGOD_TOKEN, ALGOD_URL)
+
+# Suggested params are valid for 1000 rounds (~55 min); refetch well before
+PARAMS_MAX_AGE = 600
+_params = None
+_params_fetched_at = 0.0
+
+def fetch_suggested_params(client):
+    """Fetch suggested params with a flat fee so the SDK skips per-byte fee sizing"""
+    params = client.suggested_params()
+    params.flat_fee = True
+    params.fee = max(params.min_fee, constants.MIN_TXN_FEE)
+    return params
+
+def get_suggested_params(client):
+    """Fetch suggested params once and reuse them across transactions"""
+    global _params, _params_fetched_at
+
+    if _params is None or time.monotonic() - _params_fetched_at > PARAMS_MAX_AGE:
+        _params = fetch_suggested_params(client)
+        _params_fetched_at = time.monotonic()
+    return _params
+
+def send_with_retry(client, signed_txn, attempts=3):
+    """Send a signed transaction, retrying transient failures with the same signed bytes"""
+    blob = encoding.msgpack_encode(signed_txn)
+    txid = signed_txn.get_txid()
+
+    for attempt in range(attempts):
+        try:
+            return client.send_raw_transaction(blob)
+        except (httpx.ConnectError, httpx.ConnectTimeout):
+            # The request never reached algod, so resending is safe. Later
+            # transport errors (read timeouts, dropped responses) may follow an
+            # accepted POST and are not retried
+            if attempt == attempts - 1:
+                raise
+        except error.AlgodHTTPError as e:
+            # 4xx means algod rejected the transaction; resending won't help.
+            # After a resend it may just mean the first attempt got through
+            if e.code and e.code < 500:
+                if attempt > 0:
+                    try:
+                        client.pending_transaction_info(txid)
+                        return txid
+                    except error.AlgodHTTPError:
+                        pass
+                raise
+            if attempt == attempts - 1:
+                raise
+        time.sleep(0.5 * 2 ** attempt)
+
+def prefetch_while_waiting(client, asset_id, status, stop, interval=2):
+    """Keep suggested params and the receiver's opt-in status warm while the user opts in"""
+    global _params, _params_fetched_at
+
+    while not stop.is_set():
+        try:
+            _params = fetch_suggested_params(client)
+            _params_fetched_at = time.monotonic()
+            if not status['opted_in']:
+                client.account_asset_info(YOUR_WALLET, asset_id)
+                status['opted_in'] = True
+        except Exception:
+            pass
+        stop.wait(interval)
+
 def main():
-    client = algod.AlgodClient(ALGOD_TOKEN, ALGOD_URL)
+    client = CLIENT
 
-    print("=" * 60)
-    print("NFT Creation & Transfer Script")
-    print("=" * 60)
+    print("\n".join([
+        "=" * 60,
+        "NFT Creation & Transfer Script",
+        "=" * 60
+    ]))
 
     # Step 1: Generate temporary wallet for NFT creation
     print("\n📝 Generating temporary wallet for NFT creation...")
     creator_private_key, creator_address = account.generate_account()
 
-    print(f"Temporary wallet: {creator_address}")
-    print(f"\n💰 Fund this wallet with test ALGO:")
-    print(f"   https://bank.testnet.algorand.network/")
-    print(f"\n⚠️  You need to fund this address before continuing!")
+    print("\n".join([
+        f"Temporary wallet: {creator_address}",
+        "\n💰 Fund this wallet with test ALGO:",
+        "   https://bank.testnet.algorand.network/",
+        "\n⚠️  You need to fund this address before continuing!"
+    ]))
 
     input("\nPress ENTER after funding the wallet...")
 
     # Check balance
     try:
         account_info = client.account_info(creator_address)
-        balance = account_info.get('amount') / 1_000_000
-        print(f"\n✅ Balance: {balance} ALGO")
+        amount = account_info.get('amount', 0)  # microAlgos
+        print(f"\n✅ Balance: {amount / 1_000_000} ALGO")
 
-        if balance < 0.3:
+        if amount < 300_000:
             print("❌ Need at least 0.3 ALGO (for NFT creation + transfer)")
             return
     except Exception as e:
@@ -45,7 +171,7 @@ def main():
 
     # Step 2: Create NFT
     print(f"\n🎨 Creating API Access NFT...")
-    params = client.suggested_params()
+    params = get_suggested_params(client)
 
     txn = transaction.AssetConfigTxn(
         sender=creator_address,
@@ -71,19 +197,32 @@ def main():
     confirmed_txn = transaction.wait_for_confirmation(client, txid, 4)
     asset_id = confirmed_txn.get('asset-index')
 
-    print(f"\n✅ NFT CREATED!")
-    print(f"Asset ID: {asset_id}")
-    print(f"https://testnet.algoexplorer.io/asset/{asset_id}")
+    print("\n".join([
+        "\n✅ NFT CREATED!",
+        f"Asset ID: {asset_id}",
+        f"https://testnet.algoexplorer.io/asset/{asset_id}"
+    ]))
 
     # Step 3: Opt-in to asset (your wallet must accept it first)
-    print(f"\n📥 Your Pera Wallet needs to opt-in to receive the NFT")
-    print(f"\nOption 1 (Automatic - needs your mnemonic):")
-    print(f"   Enter your 25-word mnemonic to auto opt-in")
-    print(f"\nOption 2 (Manual - safer):")
-    print(f"   1. Open Pera Wallet app")
-    print(f"   2. Go to 'Add Asset'")
-    print(f"   3. Search for asset ID: {asset_id}")
-    print(f"   4. Click 'Add'")
+    print("\n".join([
+        "\n📥 Your Pera Wallet needs to opt-in to receive the NFT",
+        "\nOption 1 (Automatic - needs your mnemonic):",
+        "   Enter your 25-word mnemonic to auto opt-in",
+        "\nOption 2 (Manual - safer):",
+        "   1. Open Pera Wallet app",
+        "   2. Go to 'Add Asset'",
+        f"   3. Search for asset ID: {asset_id}",
+        "   4. Click 'Add'"
+    ]))
+
+    # Overlap the RPCs the transfer needs with the user's opt-in
+    prefetch_status = {'opted_in': False}
+    stop_prefetch = threading.Event()
+    threading.Thread(
+        target=prefetch_while_waiting,
+        args=(client, asset_id, prefetch_status, stop_prefetch),
+        daemon=True
+    ).start()
 
     choice = input("\nUse automatic opt-in? (y/n): ").lower()
 
@@ -94,15 +233,16 @@ def main():
         try:
             from algosdk import mnemonic
             user_private_key = mnemonic.to_private_key(user_mnemonic)
-            user_address = account.address_from_private_key(user_private_key)
+            user_address = YOUR_WALLET
 
-            if user_address != YOUR_WALLET:
+            # Algorand private keys are seed + public key; compare the key bytes directly
+            if base64.b64decode(user_private_key)[32:] != YOUR_WALLET_PK:
                 print(f"❌ Mnemonic doesn't match wallet {YOUR_WALLET}")
                 print("Please opt-in manually in Pera Wallet app")
                 input("Press ENTER after opting in...")
             else:
                 # Opt-in transaction
-                params = client.suggested_params()
+                params = get_suggested_params(client)
                 opt_in_txn = transaction.AssetTransferTxn(
                     sender=user_address,
                     sp=params,
@@ -111,7 +251,7 @@ def main():
                     index=asset_id
                 )
                 signed_opt_in = opt_in_txn.sign(user_private_key)
-                txid = client.send_transaction(signed_opt_in)
+                txid = send_with_retry(client, signed_opt_in)
                 transaction.wait_for_confirmation(client, txid, 4)
                 print("✅ Opt-in successful!")
 
@@ -123,9 +263,17 @@ def main():
         print("\n👉 Please opt-in manually in Pera Wallet, then press ENTER")
         input()
 
+    stop_prefetch.set()
+
+    if not prefetch_status['opted_in']:
+        try:
+            client.account_asset_info(YOUR_WALLET, asset_id)
+        except Exception:
+            print(f"⚠️  Opt-in to asset {asset_id} not detected yet - the transfer may fail")
+
     # Step 4: Transfer NFT
     print(f"\n📤 Transferring NFT to your wallet...")
-    params = client.suggested_params()
+    params = get_suggested_params(client)
 
     transfer_txn = transaction.AssetTransferTxn(
         sender=creator_address,
@@ -136,15 +284,17 @@ def main():
     )
 
     signed_transfer = transfer_txn.sign(creator_private_key)
-    txid = client.send_transaction(signed_transfer)
+    txid = send_with_retry(client, signed_transfer)
 
     print(f"Transfer transaction ID: {txid}")
     transaction.wait_for_confirmation(client, txid, 4)
 
-    print(f"\n🎉 SUCCESS! NFT transferred to your wallet!")
-    print(f"Check your Pera Wallet - you should see the NFT now")
-    print(f"\n🔍 Verify on explorer:")
-    print(f"https://testnet.algoexplorer.io/address/{YOUR_WALLET}")
+    print("\n".join([
+        "\n🎉 SUCCESS! NFT transferred to your wallet!",
+        "Check your Pera Wallet - you should see the NFT now",
+        "\n🔍 Verify on explorer:",
+        f"https://testnet.algoexplorer.io/address/{YOUR_WALLET}"
+    ]))
 
     # Save config
     config = {
@@ -154,23 +304,23 @@ def main():
         "explorer_url": f"https://testnet.algoexplorer.io/asset/{asset_id}"
     }
 
-    with open('nft_config.json', 'w') as f:
-        json.dump(config, f, indent=2)
+    with open('nft_config.json', 'wb') as f:
+        f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
 
     print(f"\n📝 Configuration saved to nft_config.json")
 
-    # Update .env
-    with open('.env', 'r') as f:
-        env_content = f.read()
-
-    env_content = env_content.replace('NFT_ASSET_ID=', f'NFT_ASSET_ID={asset_id}')
-
-    with open('.env', 'w') as f:
-        f.write(env_content)
-
-    print(f"✅ .env updated with NFT_ASSET_ID={asset_id}")
-    print(f"\n🚀 Ready to start the API server!")
-    print(f"   python api_server.py")
+    # Update .env (only the NFT_ASSET_ID line is rewritten)
+    with fileinput.input('.env', inplace=True) as f:
+        for line in f:
+            if line.startswith('NFT_ASSET_ID='):
+                line = f'NFT_ASSET_ID={asset_id}\n'
+            print(line, end='')
+
+    print("\n".join([
+        f"✅ .env updated with NFT_ASSET_ID={asset_id}",
+        "\n🚀 Ready to start the API server!",
+        "   python api_server.py"
+    ]))
 
 if __name__ == "__main__":
     main()
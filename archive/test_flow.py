@@ -4,9 +4,12 @@ Test the complete NFT authentication flow via command line
 Simulates what the browser wallet would do
 """
 
-import requests
+import asyncio
+import httpx
 import json
+import os
 from algosdk import encoding
+from nacl.bindings import crypto_sign
 import base64
 
 # Load our test wallet
@@ -16,91 +19,98 @@ with open('temp_wallet.json', 'r') as f:
 ADDRESS = wallet['address']
 PRIVATE_KEY = wallet['private_key']
 
-API_URL = "http://localhost:8000"
-
-print("=" * 60)
-print("NFT API Authentication Flow - Command Line Test")
-print("=" * 60)
-print(f"\nWallet: {ADDRESS}")
-print(f"NFT Asset ID: 747080196")
-
-# Step 1: Get challenge
-print("\n📝 Step 1: Requesting authentication challenge...")
-response = requests.post(f"{API_URL}/auth/challenge", json={
-    "address": ADDRESS
-})
-
-if response.status_code != 200:
-    print(f"❌ Failed: {response.text}")
-    exit(1)
-
-challenge = response.json()
-print(f"✅ Challenge received:")
-print(f"   Nonce: {challenge['nonce'][:32]}...")
-print(f"   Timestamp: {challenge['timestamp']}")
-
-# Step 2: Sign challenge (what Pera Wallet would do)
-print(f"\n✍️  Step 2: Signing challenge with private key...")
-message = json.dumps(challenge, separators=(',', ':')).encode('utf-8')
-
-# Sign the message
-from nacl.signing import SigningKey
-signing_key = SigningKey(base64.b64decode(PRIVATE_KEY)[:32])
-signature_bytes = signing_key.sign(message).signature
-signature_b64 = base64.b64encode(signature_bytes).decode('utf-8')
-
-print(f"✅ Signature created: {signature_b64[:40]}...")
-
-# Step 3: Verify signature and get JWT
-print(f"\n🔍 Step 3: Verifying signature + NFT ownership...")
-response = requests.post(f"{API_URL}/auth/verify", json={
-    "address": ADDRESS,
-    "signature": signature_b64,
-    "challenge": challenge
-})
-
-if response.status_code != 200:
-    print(f"❌ Verification failed: {response.text}")
-    exit(1)
-
-auth_data = response.json()
-access_token = auth_data['access_token']
-
-print(f"✅ Authentication successful!")
-print(f"   Access Token: {access_token[:40]}...")
-print(f"   Expires in: {auth_data['expires_in']}s")
-
-# Step 4: Call protected API
-print(f"\n🔐 Step 4: Calling protected API endpoint...")
-response = requests.get(f"{API_URL}/api/protected", headers={
-    "Authorization": f"Bearer {access_token}"
-})
-
-if response.status_code != 200:
-    print(f"❌ API call failed: {response.text}")
-    exit(1)
-
-protected_data = response.json()
-
-print(f"✅ Protected data received!")
-print(f"\n{json.dumps(protected_data, indent=2)}")
-
-# Step 5: Call user info endpoint
-print(f"\n👤 Step 5: Getting user info...")
-response = requests.get(f"{API_URL}/api/user/info", headers={
-    "Authorization": f"Bearer {access_token}"
-})
-
-if response.status_code == 200:
-    user_info = response.json()
-    print(f"✅ User info:")
-    print(f"\n{json.dumps(user_info, indent=2)}")
-
-print(f"\n" + "=" * 60)
-print("🎉 SUCCESS! NFT-based authentication works!")
-print("=" * 60)
-print(f"\n✅ Proved wallet ownership via cryptographic signature")
-print(f"✅ Verified NFT ownership on Algorand blockchain")
-print(f"✅ Received JWT access token")
-print(f"✅ Accessed protected API endpoints")
-print(f"\n💡 No API keys needed - NFT = access credential!")
+# Algorand private keys are the 64-byte libsodium secret key (seed + public key)
+SECRET_KEY = base64.b64decode(PRIVATE_KEY)
+
+API_URL = os.getenv("API_URL", "http://localhost:8000")
+
+
+async def main():
+    print("=" * 60)
+    print("NFT API Authentication Flow - Command Line Test")
+    print("=" * 60)
+    print(f"\nWallet: {ADDRESS}")
+    print(f"NFT Asset ID: 747080196")
+
+    # One keep-alive client for the whole flow; over https the two
+    # concurrent GETs in steps 4/5 share a single HTTP/2 connection
+    async with httpx.AsyncClient(base_url=API_URL, timeout=10.0, http2=True) as client:
+        # Step 1: Get challenge
+        print("\n📝 Step 1: Requesting authentication challenge...")
+        response = await client.post("/auth/challenge", json={
+            "address": ADDRESS
+        })
+
+        if response.status_code != 200:
+            print(f"❌ Failed: {response.text}")
+            exit(1)
+
+        challenge = response.json()
+        print(f"✅ Challenge received:")
+        print(f"   Nonce: {challenge['nonce'][:32]}...")
+        print(f"   Timestamp: {challenge['timestamp']}")
+
+        # Step 2: Sign challenge (what Pera Wallet would do)
+        print(f"\n✍️  Step 2: Signing challenge with private key...")
+        message = base64.b64decode(challenge['message_b64'])
+
+        # Sign the message (crypto_sign returns signature + message)
+        signature_bytes = crypto_sign(message, SECRET_KEY)[:64]
+        signature_b64 = base64.b64encode(signature_bytes).decode('utf-8')
+
+        print(f"✅ Signature created: {signature_b64[:40]}...")
+
+        # Step 3: Verify signature and get JWT
+        print(f"\n🔍 Step 3: Verifying signature + NFT ownership...")
+        response = await client.post("/auth/verify", json={
+            "address": ADDRESS,
+            "signature": signature_b64,
+            "challenge": challenge
+        })
+
+        if response.status_code != 200:
+            print(f"❌ Verification failed: {response.text}")
+            exit(1)
+
+        auth_data = response.json()
+        access_token = auth_data['access_token']
+
+        print(f"✅ Authentication successful!")
+        print(f"   Access Token: {access_token[:40]}...")
+        print(f"   Expires in: {auth_data['expires_in']}s")
+
+        # Steps 4 & 5: Call protected API and user info endpoint concurrently
+        print(f"\n🔐 Step 4: Calling protected API endpoint...")
+        print(f"👤 Step 5: Getting user info...")
+        headers = {"Authorization": f"Bearer {access_token}"}
+        response, info_response = await asyncio.gather(
+            client.get("/api/protected", headers=headers),
+            client.get("/api/user/info", headers=headers)
+        )
+
+    if response.status_code != 200:
+        print(f"❌ API call failed: {response.text}")
+        exit(1)
+
+    protected_data = response.json()
+
+    print(f"✅ Protected data received!")
+    print(f"\n{json.dumps(protected_data, indent=2)}")
+
+    if info_response.status_code == 200:
+        user_info = info_response.json()
+        print(f"✅ User info:")
+        print(f"\n{json.dumps(user_info, indent=2)}")
+
+    print(f"\n" + "=" * 60)
+    print("🎉 SUCCESS! NFT-based authentication works!")
+    print("=" * 60)
+    print(f"\n✅ Proved wallet ownership via cryptographic signature")
+    print(f"✅ Verified NFT ownership on Algorand blockchain")
+    print(f"✅ Received JWT access token")
+    print(f"✅ Accessed protected API endpoints")
+    print(f"\n💡 No API keys needed - NFT = access credential!")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -80,7 +80,7 @@ export function useAuth() {
 
       // Step 2: Sign challenge with wallet
       console.log('✍️ Signing challenge...')
-      const message = new TextEncoder().encode(JSON.stringify(challenge))
+      const message = Uint8Array.from(atob(challenge.message_b64), (c) => c.charCodeAt(0))
 
       const signedData = await signData(
         [
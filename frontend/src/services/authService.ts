@@ -9,6 +9,7 @@ export interface Challenge {
   timestamp: number
   address: string
   domain: string
+  message_b64: string // base64 of the exact bytes to sign
 }
 
 export interface AuthToken {
@@ -4,37 +4,352 @@ Unified NFT Manager - Mint, Transfer, View NFT Capabilities
 Streamlined for Pera Wallet integration on TestNet/DevNet
 """
 
-from algosdk.v2client import algod, indexer
-from algosdk import account, transaction, mnemonic
-import json
+from algosdk.v2client import algod
+from algosdk import account, constants, encoding, error, transaction, mnemonic
+from cachetools import TTLCache
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from urllib import parse
+import argparse
+import base64
+import httpx
+import io
+import itertools
+import logging
+import msgpack
+import multiprocessing
+import orjson
 import os
+import random
+import shutil
+import sys
+import threading
+import time
 from typing import Optional, Dict, List
 from dotenv import load_dotenv
+from dotenv.parser import parse_stream
 
 load_dotenv()
 
+# Progress output goes through logging so it can be silenced (LOG_LEVEL=WARNING)
+logger = logging.getLogger(__name__)
+
 # TestNet/DevNet Configuration
 ALGOD_URL = os.getenv('ALGORAND_ALGOD_URL', 'https://testnet-api.algonode.cloud')
 ALGOD_TOKEN = os.getenv('ALGORAND_ALGOD_TOKEN', '')
-INDEXER_URL = os.getenv('ALGORAND_INDEXER_URL', 'https://testnet-idx.algonode.cloud')
-INDEXER_TOKEN = os.getenv('ALGORAND_INDEXER_TOKEN', '')
+ENV_PATH = '.env'
+
+# Cache lifetimes (seconds): asset params are effectively immutable for an NFT,
+# suggested params change once per block (~3.3 s), balances change with every txn
+ASSET_INFO_TTL = 3600
+PARAMS_TTL = 2
+BALANCE_TTL = 1
+HOLDINGS_TTL = 1
+
+# Retry transient RPC failures (rate limits, dropped connections) with
+# exponential backoff and jitter: ~0.25 s, 0.5 s, 1 s, 2 s
+RPC_RETRIES = 4
+RPC_BACKOFF = 0.25
+RPC_BACKOFF_MAX = 5
+# Reads are resent on any transient status; POSTs only on statuses that mean
+# the node refused the request before processing it
+RETRY_STATUS = {429, 500, 502, 503, 504}
+RETRY_STATUS_POST = {429, 503}
+
+# Batches at least this large are signed on a process pool; below it the
+# pool's startup costs more than the signing it parallelizes
+SIGN_PROCESS_THRESHOLD = int(os.getenv('SIGN_PROCESS_THRESHOLD', '256'))
+
+# Mint note encoding: "json" (default; what explorers and ARC-69 tooling read)
+# or "msgpack" (~20% smaller; decode with msgpack.unpackb(note, raw=False))
+NOTE_FORMAT = os.getenv('NOTE_FORMAT', 'json').lower()
+
+
+def new_http_session() -> httpx.Client:
+    """Keep-alive HTTP session shared by every algod request"""
+    return httpx.Client(
+        transport=httpx.HTTPTransport(retries=3),
+        limits=httpx.Limits(max_keepalive_connections=4, max_connections=16)
+    )
+
+
+def build_request_url(address: str, requrl: str, params: Optional[Dict]) -> str:
+    """Build a full API URL the same way the SDK clients do"""
+    if requrl not in constants.unversioned_paths:
+        requrl = algod.api_version_path_prefix + requrl
+    if params:
+        requrl = requrl + "?" + parse.urlencode(params)
+    return address + requrl
+
+
+def request_with_retry(session: httpx.Client, method: str, url: str, **kwargs) -> httpx.Response:
+    """Send a request, backing off exponentially (with jitter) on transient failures"""
+    retry_status = RETRY_STATUS if method == "GET" else RETRY_STATUS_POST
+    
+    for attempt in range(RPC_RETRIES + 1):
+        last = attempt == RPC_RETRIES
+        try:
+            resp = session.request(method, url, **kwargs)
+        except httpx.TransportError:
+            # Connect failures are already retried by the transport; anything
+            # later may have reached the node, so only reads are resent
+            if last or method != "GET":
+                raise
+        else:
+            if last or resp.status_code not in retry_status:
+                return resp
+        time.sleep(min(RPC_BACKOFF_MAX, RPC_BACKOFF * 2 ** attempt) * random.uniform(0.5, 1))
+
+
+def error_details(resp: httpx.Response) -> tuple:
+    """Extract the API error message and data field from a failed response"""
+    try:
+        body = resp.json()
+        return body["message"], body.get("data")
+    except Exception:
+        return resp.text, None
+
+
+@lru_cache(maxsize=64)
+def note_prefix(nft_name: str, unit_name: str, capabilities: tuple) -> bytes:
+    """Serialized mint note up to (not including) the per-mint created_at field"""
+    return orjson.dumps({
+        "name": nft_name,
+        "unit_name": unit_name,
+        "capabilities": list(capabilities),
+    })[:-1]
+
+
+def sign_transaction(txn: transaction.Transaction, private_key: str) -> transaction.SignedTransaction:
+    """Sign one transaction (module-level so process pool workers can run it)"""
+    return txn.sign(private_key)
+
+
+class PooledAlgodClient(algod.AlgodClient):
+    """AlgodClient that sends every request over a shared keep-alive session"""
+    
+    def __init__(self, algod_token, algod_address, session: httpx.Client, headers=None):
+        super().__init__(algod_token, algod_address, headers)
+        self.session = session
+    
+    def algod_request(self, method, requrl, params=None, data=None,
+                      headers=None, response_format="json", timeout=30):
+        header = {"User-Agent": "py-algorand-sdk"}
+        if self.headers:
+            header.update(self.headers)
+        if headers:
+            header.update(headers)
+        if requrl not in constants.no_auth:
+            header[constants.algod_auth_header] = self.algod_token
+        
+        resp = request_with_retry(
+            self.session,
+            method,
+            build_request_url(self.algod_address, requrl, params),
+            headers=header,
+            content=data,
+            timeout=timeout
+        )
+        
+        if resp.is_error:
+            message, data = error_details(resp)
+            raise error.AlgodHTTPError(message, resp.status_code, data)
+        
+        if response_format == "json":
+            return resp.json() if resp.content else {}
+        return resp.content
 
 
 class NFTManager:
     """Unified NFT management for capability-based access control"""
     
-    def __init__(self):
-        self.algod_client = algod.AlgodClient(ALGOD_TOKEN, ALGOD_URL)
-        self.indexer_client = indexer.IndexerClient(INDEXER_TOKEN, INDEXER_URL)
+    def __init__(self, prefetch_params: bool = True):
+        # One keep-alive session instead of a new TLS handshake per call
+        self.session = new_http_session()
+        self.algod_client = PooledAlgodClient(ALGOD_TOKEN, ALGOD_URL, self.session)
+        # Runs independent RPCs side by side so they cost one round trip, not several
+        self.executor = ThreadPoolExecutor(max_workers=16)
+        # Short-lived RPC caches shared by every operation on this manager
+        self.cache_lock = threading.Lock()
+        self.asset_info_cache = TTLCache(maxsize=1024, ttl=ASSET_INFO_TTL)
+        self.params_cache = TTLCache(maxsize=1, ttl=PARAMS_TTL)
+        self.balance_cache = TTLCache(maxsize=256, ttl=BALANCE_TTL)
+        self.asset_ids_cache = TTLCache(maxsize=256, ttl=HOLDINGS_TTL)
+        # Parsed .env, loaded on first update and reloaded if the file changes
+        self._env_entries: Optional[List[str]] = None
+        self._env_index: Dict[str, int] = {}
+        self._env_stat: Optional[tuple] = None
+        # Start fetching params now so the first transaction doesn't wait on them
+        self._params_prefetch = (
+            self.executor.submit(self._load_suggested_params) if prefetch_params else None
+        )
+    
+    def close(self):
+        """Close the shared HTTP session and RPC threads"""
+        self.executor.shutdown(wait=False)
+        self.session.close()
     
-    def get_account_balance(self, address: str) -> float:
-        """Get account balance in ALGO"""
+    def __del__(self):
+        executor = getattr(self, 'executor', None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+        session = getattr(self, 'session', None)
+        if session is not None:
+            session.close()
+    
+    def _cached(self, cache: TTLCache, key, fetch):
+        """Return cache[key], calling fetch() to fill it on a miss"""
+        with self.cache_lock:
+            value = cache.get(key)
+        if value is None:
+            value = fetch()
+            with self.cache_lock:
+                cache[key] = value
+        return value
+    
+    def _fetch_suggested_params(self) -> transaction.SuggestedParams:
+        """Fetch suggested params with a flat fee so the SDK skips per-byte fee sizing"""
+        params = self.algod_client.suggested_params()
+        params.flat_fee = True
+        params.fee = max(params.min_fee, constants.MIN_TXN_FEE)
+        return params
+    
+    def _load_suggested_params(self) -> transaction.SuggestedParams:
+        return self._cached(self.params_cache, 'params', self._fetch_suggested_params)
+    
+    def get_suggested_params(self) -> transaction.SuggestedParams:
+        """Get suggested params, reusing them for back-to-back transactions"""
+        # Join the startup prefetch if it's still in flight rather than racing it
+        prefetch = self._params_prefetch
+        if prefetch is not None and not prefetch.done():
+            try:
+                return prefetch.result()
+            except Exception:
+                pass
+        return self._load_suggested_params()
+    
+    def send_signed(self, signed_txns: List) -> List[str]:
+        """
+        Submit signed transactions (a single one or one atomic group) in one POST
+        
+        The txids are computed locally from the signed bytes, so the response
+        body is never parsed.
+        """
+        blob = b"".join(base64.b64decode(encoding.msgpack_encode(stxn)) for stxn in signed_txns)
+        self.algod_client.algod_request(
+            "POST", "/transactions", data=blob,
+            headers={"Content-Type": "application/x-binary"},
+            response_format="msgpack"
+        )
+        return [stxn.get_txid() for stxn in signed_txns]
+    
+    def wait_for_confirmation(self, txid: str, last_round: int, wait_rounds: int = 4) -> Dict:
+        """
+        Wait for a transaction to be confirmed
+        
+        Like transaction.wait_for_confirmation, but starts from a round we already
+        know (the params' first valid round) instead of spending an RPC on status(),
+        and follows the node's reported round so a stale start never costs extra polls.
+        """
+        current_round = last_round
+        end_round = last_round + wait_rounds
+        
+        while current_round <= end_round:
+            try:
+                tx_info = self.algod_client.pending_transaction_info(txid)
+                if tx_info.get('pool-error'):
+                    raise error.TransactionRejectedError(
+                        "Transaction rejected: " + tx_info['pool-error']
+                    )
+                if tx_info.get('confirmed-round', 0) > 0:
+                    return tx_info
+            except error.AlgodHTTPError:
+                # May 404 briefly behind a load balancer; keep waiting
+                pass
+            
+            # Long-poll: algod holds the request until the next block lands
+            status = self.algod_client.status_after_block(current_round)
+            node_round = status.get('last-round', 0)
+            if node_round > current_round + 1:
+                # Params were fetched a while ago; count the window from the chain's tip
+                end_round = max(end_round, node_round - 1 + wait_rounds)
+            current_round = max(current_round + 1, node_round)
+        
+        raise error.ConfirmationTimeoutError(f"Wait for transaction id {txid} timed out")
+    
+    def get_asset_ids(self, address: str) -> frozenset:
+        """Get the IDs of every asset an account has opted in to"""
+        return self._cached(
+            self.asset_ids_cache, address,
+            lambda: frozenset(
+                a['asset-id'] for a in self.algod_client.account_info(address).get('assets', [])
+            )
+        )
+    
+    def get_account_balance_micro(self, address: str) -> int:
+        """Get account balance in microAlgos"""
         try:
-            account_info = self.algod_client.account_info(address)
-            return account_info.get('amount', 0) / 1_000_000
+            return self._cached(
+                self.balance_cache, address,
+                lambda: self.algod_client.account_info(address).get('amount', 0)
+            )
         except Exception as e:
-            print(f"Error fetching balance: {e}")
-            return 0.0
+            logger.error("Error fetching balance: %s", e)
+            return 0
+    
+    def get_account_balance(self, address: str) -> float:
+        """Get account balance in ALGO"""
+        return self.get_account_balance_micro(address) / 1_000_000
+    
+    def _build_mint_txn(
+        self,
+        creator_address: str,
+        params: transaction.SuggestedParams,
+        nft_name: str,
+        unit_name: str,
+        metadata_url: str,
+        capabilities: Optional[List[str]],
+        serial: Optional[int] = None
+    ) -> tuple:
+        """Build the asset creation transaction and its metadata note"""
+        # Create NFT metadata note (store capabilities)
+        metadata = {
+            "name": nft_name,
+            "unit_name": unit_name,
+            "capabilities": capabilities or ["api_access"],
+            "created_at": params.first,
+        }
+        if serial is not None:
+            # Keeps otherwise identical mints in one batch from sharing a txid
+            metadata["serial"] = serial
+        
+        if NOTE_FORMAT == 'msgpack':
+            note = msgpack.packb(metadata, use_bin_type=True)
+        else:
+            note = note_prefix(nft_name, unit_name, tuple(metadata["capabilities"])) + (
+                b',"created_at":%d' % params.first
+            )
+            if serial is not None:
+                note += b',"serial":%d' % serial
+            note += b'}'
+        
+        # Create Asset Configuration Transaction
+        txn = transaction.AssetConfigTxn(
+            sender=creator_address,
+            sp=params,
+            total=1,              # Only 1 NFT exists (unique)
+            decimals=0,           # Non-divisible
+            default_frozen=False, # Transferable
+            unit_name=unit_name[:8],  # Max 8 chars
+            asset_name=nft_name[:32],  # Max 32 chars
+            url=metadata_url[:96],     # Max 96 chars
+            manager=creator_address,   # Can change settings
+            reserve=creator_address,   # Uncirculated supply holder
+            freeze=creator_address,    # Can freeze transfers
+            clawback=creator_address,  # Can revoke from holders
+            note=note
+        )
+        return txn, metadata
     
     def mint_capability_nft(
         self,
@@ -43,7 +358,8 @@ class NFTManager:
         nft_name: str = "API Access Pass",
         unit_name: str = "APIKEY",
         metadata_url: str = "https://api.example.com/nft-metadata.json",
-        capabilities: Optional[List[str]] = None
+        capabilities: Optional[List[str]] = None,
+        sp: Optional[transaction.SuggestedParams] = None
     ) -> Dict:
         """
         Mint a new NFT representing access capabilities
@@ -55,66 +371,46 @@ class NFTManager:
             unit_name: Short unit name (max 8 chars)
             metadata_url: URL to NFT metadata (IPFS recommended)
             capabilities: List of capabilities this NFT grants
+            sp: Suggested params to reuse (fetched if not given)
         
         Returns:
             Dict with asset_id, transaction_id, and metadata
         """
-        print(f"\n🎨 Minting NFT: {nft_name}")
-        print(f"Creator: {creator_address}")
+        logger.info("\n🎨 Minting NFT: %s\nCreator: %s", nft_name, creator_address)
         
-        # Check balance
-        balance = self.get_account_balance(creator_address)
-        print(f"Balance: {balance:.2f} ALGO")
+        # Check balance and fetch suggested parameters concurrently
+        params_future = None if sp else self.executor.submit(self.get_suggested_params)
+        balance_micro = self.get_account_balance_micro(creator_address)
+        balance = balance_micro / 1_000_000
+        logger.info("Balance: %.2f ALGO", balance)
         
-        if balance < 0.2:
+        if balance_micro < 200_000:
             raise ValueError(
                 f"Insufficient balance! Need at least 0.2 ALGO, have {balance:.2f}\n"
                 f"Fund your wallet at: https://bank.testnet.algorand.network/"
             )
         
-        # Get suggested parameters
-        params = self.algod_client.suggested_params()
+        params = sp or params_future.result()
         
-        # Create NFT metadata note (store capabilities)
-        metadata = {
-            "name": nft_name,
-            "unit_name": unit_name,
-            "capabilities": capabilities or ["api_access"],
-            "created_at": params.first,
-        }
-        note = json.dumps(metadata).encode('utf-8')
-        
-        # Create Asset Configuration Transaction
-        txn = transaction.AssetConfigTxn(
-            sender=creator_address,
-            sp=params,
-            total=1,              # Only 1 NFT exists (unique)
-            decimals=0,           # Non-divisible
-            default_frozen=False, # Transferable
-            unit_name=unit_name[:8],  # Max 8 chars
-            asset_name=nft_name[:32],  # Max 32 chars
-            url=metadata_url[:96],     # Max 96 chars
-            manager=creator_address,   # Can change settings
-            reserve=creator_address,   # Uncirculated supply holder
-            freeze=creator_address,    # Can freeze transfers
-            clawback=creator_address,  # Can revoke from holders
-            note=note
+        txn, metadata = self._build_mint_txn(
+            creator_address, params, nft_name, unit_name, metadata_url, capabilities
         )
         
         # Sign and send transaction
         signed_txn = txn.sign(creator_private_key)
-        txid = self.algod_client.send_transaction(signed_txn)
+        txid, = self.send_signed([signed_txn])
         
-        print(f"Transaction ID: {txid}")
-        print("Waiting for confirmation...")
+        logger.info("Transaction ID: %s\nWaiting for confirmation...", txid)
         
         # Wait for confirmation
-        confirmed_txn = transaction.wait_for_confirmation(self.algod_client, txid, 4)
+        confirmed_txn = self.wait_for_confirmation(txid, params.first)
         asset_id = confirmed_txn.get('asset-index')
         
-        print(f"\n✅ NFT Created Successfully!")
-        print(f"Asset ID: {asset_id}")
-        print(f"View on AlgoExplorer: https://testnet.algoexplorer.io/asset/{asset_id}")
+        logger.info(
+            "\n✅ NFT Created Successfully!\nAsset ID: %s\n"
+            "View on AlgoExplorer: https://testnet.algoexplorer.io/asset/%s",
+            asset_id, asset_id
+        )
         
         # Update .env file with NFT_ASSET_ID
         self._update_env_file(asset_id)
@@ -127,13 +423,102 @@ class NFTManager:
             "explorer_url": f"https://testnet.algoexplorer.io/asset/{asset_id}"
         }
     
+    def mint_many(
+        self,
+        creator_address: str,
+        creator_private_key: str,
+        count: int,
+        nft_name: str = "API Access Pass",
+        unit_name: str = "APIKEY",
+        metadata_url: str = "https://api.example.com/nft-metadata.json",
+        capabilities: Optional[List[str]] = None,
+        sp: Optional[transaction.SuggestedParams] = None
+    ) -> List[Dict]:
+        """
+        Mint several NFTs in one go
+        
+        All transactions share one set of suggested params and are signed,
+        submitted and confirmed in parallel, so a batch takes about as long
+        as a single mint. Algorand has no account nonces, so submission order
+        doesn't matter; each mint gets a serial number in its note instead.
+        The .env file is not updated.
+        
+        Returns:
+            One result dict per mint; failed mints carry an "error" key
+        """
+        if count < 1:
+            raise ValueError(f"count must be at least 1, got {count}")
+        
+        logger.info("\n🎨 Minting %d NFTs: %s", count, nft_name)
+        
+        params_future = None if sp else self.executor.submit(self.get_suggested_params)
+        balance_micro = self.get_account_balance_micro(creator_address)
+        params = sp or params_future.result()
+        
+        built = [
+            self._build_mint_txn(
+                creator_address, params, nft_name, unit_name, metadata_url, capabilities,
+                serial=serial
+            )
+            for serial in range(1, count + 1)
+        ]
+        txns = [txn for txn, _ in built]
+        
+        # Each asset raises the creator's minimum balance by 0.1 ALGO; txn.fee is
+        # the fee each transaction will actually pay (flat or sized per byte)
+        needed = 100_000 + sum(100_000 + txn.fee for txn in txns)
+        if balance_micro < needed:
+            raise ValueError(
+                f"Insufficient balance! Need at least {needed / 1_000_000:.3f} ALGO, "
+                f"have {balance_micro / 1_000_000:.3f}\n"
+                f"Fund your wallet at: https://bank.testnet.algorand.network/"
+            )
+        
+        if count >= SIGN_PROCESS_THRESHOLD:
+            # Encoding + signing is CPU-bound; spread it over every core
+            # (spawn, so workers don't inherit this process's threads and sockets)
+            with ProcessPoolExecutor(mp_context=multiprocessing.get_context('spawn')) as pool:
+                signed = list(pool.map(
+                    sign_transaction, txns, itertools.repeat(creator_private_key), chunksize=64
+                ))
+        else:
+            signed = list(self.executor.map(sign_transaction, txns, itertools.repeat(creator_private_key)))
+        
+        def submit(i: int) -> Dict:
+            txn, metadata = built[i]
+            result = {"transaction_id": txn.get_txid(), "creator": creator_address, "metadata": metadata}
+            try:
+                self.send_signed([signed[i]])
+                confirmed_txn = self.wait_for_confirmation(result["transaction_id"], params.first)
+            except Exception as e:
+                result["error"] = str(e)
+                return result
+            asset_id = confirmed_txn.get('asset-index')
+            result["asset_id"] = asset_id
+            result["explorer_url"] = f"https://testnet.algoexplorer.io/asset/{asset_id}"
+            return result
+        
+        results = list(self.executor.map(submit, range(count)))
+        
+        if logger.isEnabledFor(logging.INFO):
+            minted = [r for r in results if "error" not in r]
+            lines = [f"\n✅ Minted {len(minted)}/{count} NFTs"]
+            lines += [f"  Asset ID: {r['asset_id']}" for r in minted]
+            logger.info("\n".join(lines))
+        for r in results:
+            if "error" in r:
+                logger.error("❌ Mint %s failed: %s", r['transaction_id'], r['error'])
+        
+        return results
+    
     def transfer_nft(
         self,
         from_address: str,
         from_private_key: str,
         to_address: str,
         asset_id: int,
-        opt_in_first: bool = True
+        opt_in_first: bool = True,
+        sp: Optional[transaction.SuggestedParams] = None
     ) -> str:
         """
         Transfer NFT to another wallet
@@ -144,29 +529,29 @@ class NFTManager:
             to_address: Recipient wallet address
             asset_id: NFT asset ID to transfer
             opt_in_first: Whether to opt-in recipient first
+            sp: Suggested params to reuse (fetched if not given)
         
         Returns:
             Transaction ID
         """
-        print(f"\n📤 Transferring NFT {asset_id}")
-        print(f"From: {from_address}")
-        print(f"To: {to_address}")
+        logger.info("\n📤 Transferring NFT %s\nFrom: %s\nTo: %s", asset_id, from_address, to_address)
         
-        params = self.algod_client.suggested_params()
+        # Fetch params and the recipient's account concurrently
+        params_future = None if sp else self.executor.submit(self.get_suggested_params)
         
         # Check if recipient needs to opt-in
         if opt_in_first:
             try:
-                account_info = self.algod_client.account_info(to_address)
-                assets = account_info.get('assets', [])
-                opted_in = any(a.get('asset-id') == asset_id for a in assets)
-                
-                if not opted_in:
-                    print("⚠️  Recipient must opt-in to receive this NFT first!")
-                    print(f"They need to call: opt_in_to_asset({to_address}, {asset_id})")
+                if asset_id not in self.get_asset_ids(to_address):
+                    logger.warning(
+                        "⚠️  Recipient must opt-in to receive this NFT first!\n"
+                        "They need to call: opt_in_to_asset(%s, %s)", to_address, asset_id
+                    )
                     return ""
             except Exception as e:
-                print(f"Warning: Could not check opt-in status: {e}")
+                logger.warning("Warning: Could not check opt-in status: %s", e)
+        
+        params = sp or params_future.result()
         
         # Create transfer transaction
         txn = transaction.AssetTransferTxn(
@@ -179,19 +564,20 @@ class NFTManager:
         
         # Sign and send
         signed_txn = txn.sign(from_private_key)
-        txid = self.algod_client.send_transaction(signed_txn)
+        txid, = self.send_signed([signed_txn])
         
-        print(f"Transfer transaction ID: {txid}")
-        transaction.wait_for_confirmation(self.algod_client, txid, 4)
+        logger.info("Transfer transaction ID: %s", txid)
+        self.wait_for_confirmation(txid, params.first)
         
-        print(f"✅ NFT transferred successfully!")
+        logger.info("✅ NFT transferred successfully!")
         return txid
     
     def opt_in_to_asset(
         self,
         address: str,
         private_key: str,
-        asset_id: int
+        asset_id: int,
+        sp: Optional[transaction.SuggestedParams] = None
     ) -> str:
         """
         Opt-in to receive an NFT (required on Algorand)
@@ -200,13 +586,14 @@ class NFTManager:
             address: Wallet address opting in
             private_key: Private key to sign
             asset_id: Asset ID to opt into
+            sp: Suggested params to reuse (fetched if not given)
         
         Returns:
             Transaction ID
         """
-        print(f"\n✅ Opting in to asset {asset_id}")
+        logger.info("\n✅ Opting in to asset %s", asset_id)
         
-        params = self.algod_client.suggested_params()
+        params = sp or self.get_suggested_params()
         
         # Opt-in transaction (send 0 of asset to yourself)
         txn = transaction.AssetTransferTxn(
@@ -218,18 +605,84 @@ class NFTManager:
         )
         
         signed_txn = txn.sign(private_key)
-        txid = self.algod_client.send_transaction(signed_txn)
+        txid, = self.send_signed([signed_txn])
+        
+        logger.info("Opt-in transaction ID: %s", txid)
+        self.wait_for_confirmation(txid, params.first)
         
-        print(f"Opt-in transaction ID: {txid}")
-        transaction.wait_for_confirmation(self.algod_client, txid, 4)
+        with self.cache_lock:
+            self.asset_ids_cache.pop(address, None)
         
-        print(f"✅ Successfully opted in to asset {asset_id}")
+        logger.info("✅ Successfully opted in to asset %s", asset_id)
         return txid
     
+    def mint_and_transfer(
+        self,
+        creator_address: str,
+        creator_private_key: str,
+        recipient_address: str,
+        recipient_private_key: str,
+        nft_name: str = "API Access Pass",
+        unit_name: str = "APIKEY",
+        capabilities: Optional[List[str]] = None
+    ) -> Dict:
+        """
+        Mint an NFT and deliver it to a recipient whose key we hold
+        
+        The asset ID only exists once the mint is confirmed, so the mint has to
+        land first; the recipient's opt-in and the transfer then go out together
+        as one atomic group and confirm in a single round.
+        
+        Returns:
+            Mint result dict plus the group's transfer_transaction_id
+        """
+        result = self.mint_capability_nft(
+            creator_address=creator_address,
+            creator_private_key=creator_private_key,
+            nft_name=nft_name,
+            unit_name=unit_name,
+            capabilities=capabilities
+        )
+        asset_id = result['asset_id']
+        
+        logger.info("\n📤 Opting in and transferring NFT %s as one group", asset_id)
+        params = self.get_suggested_params()
+        
+        opt_in_txn = transaction.AssetTransferTxn(
+            sender=recipient_address,
+            sp=params,
+            receiver=recipient_address,
+            amt=0,
+            index=asset_id
+        )
+        transfer_txn = transaction.AssetTransferTxn(
+            sender=creator_address,
+            sp=params,
+            receiver=recipient_address,
+            amt=1,
+            index=asset_id
+        )
+        transaction.assign_group_id([opt_in_txn, transfer_txn])
+        
+        signed_group = [
+            opt_in_txn.sign(recipient_private_key),
+            transfer_txn.sign(creator_private_key)
+        ]
+        _, txid = self.send_signed(signed_group)
+        logger.info("Transfer transaction ID: %s", txid)
+        self.wait_for_confirmation(txid, params.first)
+        
+        logger.info("✅ NFT delivered to %s", recipient_address)
+        result["transfer_transaction_id"] = txid
+        return result
+    
     def get_nft_info(self, asset_id: int) -> Dict:
         """Get NFT information from blockchain"""
         try:
-            asset_info = self.algod_client.asset_info(asset_id)
+            asset_info = self._cached(
+                self.asset_info_cache, asset_id,
+                lambda: self.algod_client.asset_info(asset_id)
+            )
             params = asset_info.get('params', {})
             
             return {
@@ -243,78 +696,262 @@ class NFTManager:
                 "manager": params.get('manager'),
             }
         except Exception as e:
-            print(f"Error fetching NFT info: {e}")
+            logger.error("Error fetching NFT info: %s", e)
             return {}
     
     def get_wallet_nfts(self, address: str) -> List[Dict]:
         """Get all NFTs owned by a wallet"""
         try:
-            account_info = self.indexer_client.account_info(address)
-            assets = account_info.get('account', {}).get('assets', [])
+            # algod serves current holdings directly; the indexer lags the tip
+            account_info = self.algod_client.account_info(address)
+            assets = account_info.get('assets', [])
             
-            nfts = []
-            for asset in assets:
-                asset_id = asset.get('asset-id')
-                amount = asset.get('amount', 0)
-                
-                # NFTs have total=1, decimals=0, and amount>0
-                if amount > 0:
-                    info = self.get_nft_info(asset_id)
-                    if info.get('total') == 1 and info.get('decimals') == 0:
-                        nfts.append(info)
+            # NFTs have total=1, decimals=0, and amount>0
+            held = [asset.get('asset-id') for asset in assets if asset.get('amount', 0) > 0]
             
-            return nfts
+            # Look up all held assets concurrently instead of one round trip each
+            infos = self.executor.map(self.get_nft_info, held)
+            return [
+                info for info in infos
+                if info.get('total') == 1 and info.get('decimals') == 0
+            ]
         except Exception as e:
-            print(f"Error fetching wallet NFTs: {e}")
+            logger.error("Error fetching wallet NFTs: %s", e)
             return []
     
+    @staticmethod
+    def _env_file_stat() -> Optional[tuple]:
+        try:
+            st = os.stat(ENV_PATH)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+    
+    def _load_env_file(self) -> List[str]:
+        """Read .env once; later updates edit the in-memory copy unless the file changed"""
+        stat = self._env_file_stat()
+        if self._env_entries is None or stat != self._env_stat:
+            self._env_stat = stat
+            text = ''
+            if os.path.exists(ENV_PATH):
+                with open(ENV_PATH, 'r') as f:
+                    text = f.read()
+            # Split with python-dotenv's own parser so export prefixes, quoted
+            # and multi-line values are handled; the entries join back to the file.
+            # parse_stream is not public API, hence the <2.0 pin in requirements.txt
+            bindings = list(parse_stream(io.StringIO(text)))
+            self._env_entries = [b.original.string for b in bindings]
+            self._env_index = {}
+            for i, binding in enumerate(bindings):
+                if binding.key:
+                    self._env_index.setdefault(binding.key, i)
+        return self._env_entries
+    
     def _update_env_file(self, asset_id: int):
         """Update .env file with new NFT_ASSET_ID"""
-        env_path = '.env'
-        
-        if not os.path.exists(env_path):
-            print("⚠️  .env file not found, creating one...")
-            with open(env_path, 'w') as f:
-                f.write(f"NFT_ASSET_ID={asset_id}\n")
-            return
-        
-        # Read existing .env
-        with open(env_path, 'r') as f:
-            lines = f.readlines()
+        entries = self._load_env_file()
+        if not entries:
+            logger.warning("⚠️  .env file not found, creating one...")
         
         # Update or add NFT_ASSET_ID
-        updated = False
-        for i, line in enumerate(lines):
-            if line.startswith('NFT_ASSET_ID='):
-                lines[i] = f'NFT_ASSET_ID={asset_id}\n'
-                updated = True
-                break
-        
-        if not updated:
-            lines.append(f'NFT_ASSET_ID={asset_id}\n')
+        i = self._env_index.get('NFT_ASSET_ID')
+        if i is None:
+            if entries and not entries[-1].endswith('\n'):
+                entries[-1] += '\n'
+            self._env_index['NFT_ASSET_ID'] = len(entries)
+            entries.append(f'NFT_ASSET_ID={asset_id}\n')
+        else:
+            old = entries[i]
+            body = old.lstrip()
+            prefix = old[:len(old) - len(body)] + ('export ' if body.startswith('export ') else '')
+            new = f'{prefix}NFT_ASSET_ID={asset_id}\n'
+            if new == old:
+                return
+            entries[i] = new
         
-        # Write back
-        with open(env_path, 'w') as f:
-            f.writelines(lines)
+        # Write to a temp file beside the real .env (through any symlink) and swap
+        # it in so a crash can't truncate it. The temp file starts owner-only and
+        # takes the original's mode, since .env holds JWT_SECRET
+        path = os.path.realpath(ENV_PATH)
+        tmp_path = path + '.tmp'
+        try:
+            with open(tmp_path, 'w', opener=lambda p, flags: os.open(p, flags, 0o600)) as f:
+                f.writelines(entries)
+            if os.path.exists(path):
+                shutil.copymode(path, tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self._env_stat = self._env_file_stat()
         
-        print(f"✅ Updated .env with NFT_ASSET_ID={asset_id}")
+        logger.info("✅ Updated .env with NFT_ASSET_ID=%s", asset_id)
 
 
-def main():
-    """Interactive CLI for NFT management"""
-    manager = NFTManager()
-    
-    print("=" * 60)
-    print("NFT Manager - Capability-Based Access Control")
-    print("=" * 60)
+_manager: Optional[NFTManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_manager(prefetch_params: bool = True) -> NFTManager:
+    """
+    Shared NFTManager for the whole process
     
-    print("\n1. Mint new NFT")
-    print("2. Transfer NFT")
-    print("3. View wallet NFTs")
-    print("4. Get NFT info")
-    print("5. Opt-in to NFT")
+    Long-lived callers (a server, a notebook, scripts minting in a loop) should
+    use this instead of NFTManager() so the keep-alive session, caches and
+    prefetched params carry over between operations. Built on first use rather
+    than at import, so importing the module (e.g. in signing workers) stays cheap.
+    prefetch_params only applies to the call that builds the manager.
+    """
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                _manager = NFTManager(prefetch_params=prefetch_params)
+    return _manager
+
+
+MENU = "\n".join([
+    "=" * 60,
+    "NFT Manager - Capability-Based Access Control",
+    "=" * 60,
+    "",
+    "1. Mint new NFT",
+    "2. Transfer NFT",
+    "3. View wallet NFTs",
+    "4. Get NFT info",
+    "5. Opt-in to NFT",
+])
+
+
+def print_wallet_nfts(address: str, nfts: List[Dict]):
+    """Print the NFTs held by a wallet"""
+    lines = [f"\n📦 NFTs in wallet {address}:"]
+    for nft in nfts:
+        lines += [
+            f"\n  Asset ID: {nft['asset_id']}",
+            f"  Name: {nft['name']}",
+            f"  Unit: {nft['unit_name']}",
+            f"  Creator: {nft['creator']}",
+        ]
+    print("\n".join(lines))
+
+
+def print_nft_info(info: Dict):
+    """Print NFT details"""
+    lines = ["\n📋 NFT Info:"]
+    lines += [f"  {key}: {value}" for key, value in info.items()]
+    print("\n".join(lines))
+
+
+@lru_cache(maxsize=8)
+def _derive_keys(phrase: str) -> tuple:
+    private_key = mnemonic.to_private_key(phrase)
+    return private_key, account.address_from_private_key(private_key)
+
+
+def keys_from_mnemonic(phrase: str) -> tuple:
+    """Derive (private_key, address) from a mnemonic, once per distinct phrase"""
+    # Normalize so the same words typed with different spacing/case share an entry
+    return _derive_keys(" ".join(phrase.lower().split()))
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse CLI arguments; no command means interactive mode"""
+    parser = argparse.ArgumentParser(
+        description="NFT Manager - Capability-Based Access Control"
+    )
+    commands = parser.add_subparsers(dest="command")
+
+    mint = commands.add_parser("mint", help="Mint new NFT")
+    mint.add_argument("--mnemonic", required=True, help="Creator 25-word mnemonic")
+    mint.add_argument("--name", default="API Access Pass", help="NFT name")
+    mint.add_argument("--unit-name", default="APIKEY", help="Unit name")
+    mint.add_argument("--count", type=int, default=1, help="Number of NFTs to mint")
+
+    transfer = commands.add_parser("transfer", help="Transfer NFT")
+    transfer.add_argument("--mnemonic", required=True, help="Sender 25-word mnemonic")
+    transfer.add_argument("--recipient", required=True, help="Recipient address")
+    transfer.add_argument("--asset-id", type=int, required=True, help="Asset ID")
+
+    view = commands.add_parser("view", help="View wallet NFTs")
+    view.add_argument("--address", required=True, help="Wallet address")
+
+    info = commands.add_parser("info", help="Get NFT info")
+    info.add_argument("--asset-id", type=int, required=True, help="Asset ID")
+
+    opt_in = commands.add_parser("opt-in", help="Opt-in to NFT")
+    opt_in.add_argument("--mnemonic", required=True, help="Wallet 25-word mnemonic")
+    opt_in.add_argument("--asset-id", type=int, required=True, help="Asset ID")
+
+    args = parser.parse_args(argv)
+    if args.command == "mint" and args.count < 1:
+        parser.error("--count must be at least 1")
+    return args
+
+
+def run_command(manager: NFTManager, args: argparse.Namespace):
+    """Run a single non-interactive command"""
+    if args.command in ("mint", "transfer", "opt-in"):
+        private_key, address = keys_from_mnemonic(args.mnemonic)
+
+    if args.command == "mint" and args.count > 1:
+        results = manager.mint_many(
+            creator_address=address,
+            creator_private_key=private_key,
+            count=args.count,
+            nft_name=args.name,
+            unit_name=args.unit_name
+        )
+        print("\n".join(
+            f"❌ {r['transaction_id']}: {r['error']}" if "error" in r
+            else f"✅ Asset ID: {r['asset_id']}"
+            for r in results
+        ))
+
+    elif args.command == "mint":
+        result = manager.mint_capability_nft(
+            creator_address=address,
+            creator_private_key=private_key,
+            nft_name=args.name,
+            unit_name=args.unit_name
+        )
+        print(f"\n✅ Asset ID: {result['asset_id']}\nExplorer: {result['explorer_url']}")
+
+    elif args.command == "transfer":
+        manager.transfer_nft(address, private_key, args.recipient, args.asset_id)
+
+    elif args.command == "view":
+        print_wallet_nfts(args.address, manager.get_wallet_nfts(args.address))
+
+    elif args.command == "info":
+        print_nft_info(manager.get_nft_info(args.asset_id))
+
+    elif args.command == "opt-in":
+        manager.opt_in_to_asset(address, private_key, args.asset_id)
+
+
+def main():
+    """CLI for NFT management (interactive when no command is given)"""
+    args = parse_args()
+    logging.basicConfig(format="%(message)s", stream=sys.stdout)
+    logger.setLevel(os.getenv('LOG_LEVEL', 'INFO').upper())
+
+    if args.command:
+        # Read-only commands never send a transaction, so skip the params prefetch
+        run_command(get_manager(prefetch_params=args.command not in ("view", "info")), args)
+        return
+
+    print(MENU)
     
     choice = input("\nSelect option (1-5): ").strip()
+    manager = get_manager(prefetch_params=False)
+    
+    # Fetch params in the background while the user answers the prompts;
+    # they stay valid for 1000 rounds, so a slow typist still gets usable ones
+    params_future = None
+    if choice in ("1", "2", "5"):
+        params_future = manager.executor.submit(manager.get_suggested_params)
     
     if choice == "1":
         # Mint NFT
@@ -323,16 +960,17 @@ def main():
         
         if use_existing:
             mnemonic_phrase = input("Enter 25-word mnemonic: ").strip()
-            private_key = mnemonic.to_private_key(mnemonic_phrase)
-            address = account.address_from_private_key(private_key)
+            private_key, address = keys_from_mnemonic(mnemonic_phrase)
         else:
-            print("\n⚠️  Generating new wallet...")
             private_key, address = account.generate_account()
             phrase = mnemonic.from_private_key(private_key)
-            print(f"\n🔑 SAVE THIS MNEMONIC:")
-            print(phrase)
-            print(f"\nAddress: {address}")
-            print(f"\nFund at: https://bank.testnet.algorand.network/")
+            print("\n".join([
+                "\n⚠️  Generating new wallet...",
+                "\n🔑 SAVE THIS MNEMONIC:",
+                phrase,
+                f"\nAddress: {address}",
+                "\nFund at: https://bank.testnet.algorand.network/",
+            ]))
             input("Press Enter after funding...")
         
         nft_name = input("NFT name (default: API Access Pass): ").strip() or "API Access Pass"
@@ -342,11 +980,11 @@ def main():
             creator_address=address,
             creator_private_key=private_key,
             nft_name=nft_name,
-            unit_name=unit_name
+            unit_name=unit_name,
+            sp=params_future.result()
         )
         
-        print(f"\n✅ Asset ID: {result['asset_id']}")
-        print(f"Explorer: {result['explorer_url']}")
+        print(f"\n✅ Asset ID: {result['asset_id']}\nExplorer: {result['explorer_url']}")
     
     elif choice == "2":
         # Transfer NFT
@@ -355,41 +993,31 @@ def main():
         to_address = input("To address: ").strip()
         asset_id = int(input("Asset ID: ").strip())
         
-        from_private_key = mnemonic.to_private_key(from_mnemonic)
-        from_address = account.address_from_private_key(from_private_key)
+        from_private_key, from_address = keys_from_mnemonic(from_mnemonic)
         
-        manager.transfer_nft(from_address, from_private_key, to_address, asset_id)
+        manager.transfer_nft(
+            from_address, from_private_key, to_address, asset_id,
+            sp=params_future.result()
+        )
     
     elif choice == "3":
         # View wallet NFTs
         address = input("Wallet address: ").strip()
-        nfts = manager.get_wallet_nfts(address)
-        
-        print(f"\n📦 NFTs in wallet {address}:")
-        for nft in nfts:
-            print(f"\n  Asset ID: {nft['asset_id']}")
-            print(f"  Name: {nft['name']}")
-            print(f"  Unit: {nft['unit_name']}")
-            print(f"  Creator: {nft['creator']}")
+        print_wallet_nfts(address, manager.get_wallet_nfts(address))
     
     elif choice == "4":
         # Get NFT info
         asset_id = int(input("Asset ID: ").strip())
-        info = manager.get_nft_info(asset_id)
-        
-        print(f"\n📋 NFT Info:")
-        for key, value in info.items():
-            print(f"  {key}: {value}")
+        print_nft_info(manager.get_nft_info(asset_id))
     
     elif choice == "5":
         # Opt-in to NFT
         mnemonic_phrase = input("Wallet mnemonic: ").strip()
         asset_id = int(input("Asset ID to opt-in: ").strip())
         
-        private_key = mnemonic.to_private_key(mnemonic_phrase)
-        address = account.address_from_private_key(private_key)
+        private_key, address = keys_from_mnemonic(mnemonic_phrase)
         
-        manager.opt_in_to_asset(address, private_key, asset_id)
+        manager.opt_in_to_asset(address, private_key, asset_id, sp=params_future.result())
     
     else:
         print("Invalid option!")